@@ -5,7 +5,7 @@ from __future__ import annotations
 import dataclasses
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class BackendConfig:
     """Describes a backend instance.
 
@@ -17,7 +17,7 @@ class BackendConfig:
     options: dict[str, object] = dataclasses.field(default_factory=dict)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class StoreProfile:
     """Describes a named store.
 
@@ -31,7 +31,7 @@ class StoreProfile:
     options: dict[str, object] = dataclasses.field(default_factory=dict)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RegistryConfig:
     """Top-level configuration container.
 
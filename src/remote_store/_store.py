@@ -31,17 +31,18 @@ class Store:
     def __init__(self, backend: Backend, root_path: str = "") -> None:
         self._backend = backend
         self._root = str(RemotePath(root_path)) if root_path else ""
+        self._eq_key = (id(backend), self._root)
 
     def __repr__(self) -> str:
         return f"Store(backend={self._backend.name!r}, root_path={self._root!r})"
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Store):
-            return self._backend is other._backend and self._root == other._root
+            return self._eq_key == other._eq_key
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((id(self._backend), self._root))
+        return hash(self._eq_key)
 
     def close(self) -> None:
         """Close the underlying backend, releasing any held resources."""
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import socket
 import tempfile
-import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -17,8 +18,10 @@ if TYPE_CHECKING:
     from remote_store._backend import Backend
 
 
+@functools.cache
 def _s3_available() -> bool:
     try:
+        import boto3  # noqa: F401
         import moto  # noqa: F401
         import s3fs  # noqa: F401
 
@@ -27,17 +30,19 @@ def _s3_available() -> bool:
         return False
 
 
+@functools.cache
 def _s3_pyarrow_available() -> bool:
+    if not _s3_available():
+        return False
     try:
-        import moto  # noqa: F401
         import pyarrow  # noqa: F401
-        import s3fs  # noqa: F401
 
         return True
     except ImportError:
         return False
 
 
+@functools.cache
 def _sftp_available() -> bool:
     try:
         import paramiko  # noqa: F401
@@ -72,9 +77,30 @@ def moto_server() -> Iterator[str | None]:
     server.stop()
 
 
+@pytest.fixture(scope="session")
+def s3_admin_client(moto_server: str | None) -> Any:
+    """Session-wide boto3 client used only for bucket setup and cleanup."""
+    import boto3
+    from botocore.config import Config
+
+    assert moto_server is not None
+    return boto3.client(
+        "s3",
+        endpoint_url=moto_server,
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+        config=Config(max_pool_connections=50),
+    )
+
+
 @pytest.fixture(scope="session")
 def sftp_server() -> Iterator[tuple[int, str] | None]:
-    """Start an in-process SFTP server for the test session."""
+    """Start an in-process SFTP server for the test session.
+
+    Under pytest-xdist every worker runs its own session, so each gets a
+    private server on an OS-assigned port and its own temp root.
+    """
     if not _sftp_available():
         yield None
         return
@@ -100,14 +126,18 @@ def sftp_server() -> Iterator[tuple[int, str] | None]:
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+# Bucket names and SFTP base paths only need to be unique within one server, i.e. one session.
+_bucket_counter = itertools.count()
+_base_path_counter = itertools.count()
+
 _s3_param = pytest.param(
     "s3",
-    marks=pytest.mark.skipif(not _s3_available(), reason="moto/s3fs not installed"),
+    marks=pytest.mark.skipif(not _s3_available(), reason="moto/s3fs/boto3 not installed"),
 )
 
 _s3_pyarrow_param = pytest.param(
     "s3-pyarrow",
-    marks=pytest.mark.skipif(not _s3_pyarrow_available(), reason="pyarrow/s3fs not installed"),
+    marks=pytest.mark.skipif(not _s3_pyarrow_available(), reason="pyarrow/s3fs/moto/boto3 not installed"),
 )
 
 _sftp_param = pytest.param(
@@ -127,19 +157,11 @@ def backend(
         with tempfile.TemporaryDirectory() as tmp:
             yield LocalBackend(root=tmp)
     elif request.param == "s3":
-        import boto3
-
         from remote_store.backends._s3 import S3Backend
 
         assert moto_server is not None
-        bucket = f"conformance-{uuid.uuid4().hex[:8]}"
-        client = boto3.client(
-            "s3",
-            endpoint_url=moto_server,
-            aws_access_key_id="testing",
-            aws_secret_access_key="testing",
-            region_name="us-east-1",
-        )
+        client = request.getfixturevalue("s3_admin_client")
+        bucket = f"conformance-{next(_bucket_counter):08d}"
         client.create_bucket(Bucket=bucket)
         b = S3Backend(
             bucket=bucket,
@@ -151,19 +173,11 @@ def backend(
         yield b
         b.close()
     elif request.param == "s3-pyarrow":
-        import boto3
-
         from remote_store.backends._s3_pyarrow import S3PyArrowBackend
 
         assert moto_server is not None
-        bucket = f"conformance-pa-{uuid.uuid4().hex[:8]}"
-        client = boto3.client(
-            "s3",
-            endpoint_url=moto_server,
-            aws_access_key_id="testing",
-            aws_secret_access_key="testing",
-            region_name="us-east-1",
-        )
+        client = request.getfixturevalue("s3_admin_client")
+        bucket = f"conformance-pa-{next(_bucket_counter):08d}"
         client.create_bucket(Bucket=bucket)
         b = S3PyArrowBackend(
             bucket=bucket,
@@ -179,7 +193,7 @@ def backend(
 
         assert sftp_server is not None
         port, host_key_entry = sftp_server
-        base_path = f"/test_{uuid.uuid4().hex[:8]}"
+        base_path = f"/conformance_{next(_base_path_counter):08x}"
         b = SFTPBackend(
             host="127.0.0.1",
             port=port,
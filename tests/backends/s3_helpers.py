@@ -0,0 +1,14 @@
+"""Bucket housekeeping shared by the S3 and S3-PyArrow test fixtures."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def cleanup_bucket(client: Any, bucket: str) -> None:
+    """Delete every object in *bucket*, 1000 keys per ``DeleteObjects`` call."""
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket):
+        keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+        if keys:
+            client.delete_objects(Bucket=bucket, Delete={"Objects": keys, "Quiet": True})
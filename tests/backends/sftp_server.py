@@ -9,6 +9,7 @@ from __future__ import annotations
 import contextlib
 import os
 import socket
+import tempfile
 import threading
 from pathlib import Path, PurePosixPath
 
@@ -190,6 +191,25 @@ class StubSFTPServer(SFTPServerInterface):
 
 
 # region: server lifecycle
+# RSA-2048 generation is slow; reuse one host key across sessions and xdist workers.
+_HOST_KEY_PATH = Path(tempfile.gettempdir()) / "remote_store_test_hostkey"
+
+
+def _load_or_generate_host_key() -> RSAKey:
+    """Load the cached test host key, generating and caching it on first use."""
+    with contextlib.suppress(OSError, paramiko.SSHException):
+        return RSAKey(filename=str(_HOST_KEY_PATH))
+    key = RSAKey.generate(2048)
+    tmp_path = _HOST_KEY_PATH.with_name(f"{_HOST_KEY_PATH.name}.{os.getpid()}")
+    try:
+        with contextlib.suppress(OSError):
+            key.write_private_key_file(str(tmp_path))
+            os.replace(tmp_path, _HOST_KEY_PATH)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return key
+
+
 def _accept_connections(
     server_socket: socket.socket,
     host_key: RSAKey,
@@ -239,7 +259,7 @@ def start_sftp_server(
     Returns:
         (thread, actual_port, host_key, stop_event, server_socket)
     """
-    host_key = RSAKey.generate(2048)
+    host_key = _load_or_generate_host_key()
 
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -6,15 +6,15 @@ All tests are skipped if dependencies are not installed.
 
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 # Guard: skip entire module if dependencies are missing
 pytest.importorskip("moto", reason="moto not installed")
 pytest.importorskip("s3fs", reason="s3fs not installed")
-boto3 = pytest.importorskip("boto3", reason="boto3 not installed")
+pytest.importorskip("boto3", reason="boto3 not installed")
 
 from remote_store._capabilities import Capability, CapabilitySet  # noqa: E402
 from remote_store._errors import (  # noqa: E402
@@ -24,6 +24,7 @@ from remote_store._errors import (  # noqa: E402
     RemoteStoreError,
 )
 from remote_store._models import FileInfo, FolderInfo  # noqa: E402
+from tests.backends.s3_helpers import cleanup_bucket  # noqa: E402
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -33,23 +34,25 @@ if TYPE_CHECKING:
 REGION = "us-east-1"
 
 
+@pytest.fixture(scope="session")
+def s3_bucket(s3_admin_client: Any) -> str:
+    """One bucket per session, named per pytest-xdist worker when running in parallel."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    bucket = f"test-{worker}"
+    s3_admin_client.create_bucket(Bucket=bucket)
+    return bucket
+
+
 @pytest.fixture()
-def s3_backend(moto_server: str) -> Iterator[Backend]:
-    """Create an S3Backend against moto's mock S3 service."""
-    bucket = f"test-{uuid.uuid4().hex[:8]}"
-    client = boto3.client(
-        "s3",
-        endpoint_url=moto_server,
-        aws_access_key_id="testing",
-        aws_secret_access_key="testing",
-        region_name=REGION,
-    )
-    client.create_bucket(Bucket=bucket)
+def s3_backend(moto_server: str, s3_admin_client: Any, s3_bucket: str) -> Iterator[Backend]:
+    """Create an S3Backend against moto's mock S3 service.
 
+    The bucket is shared across the session and emptied after each test.
+    """
     from remote_store.backends._s3 import S3Backend
 
     backend = S3Backend(
-        bucket=bucket,
+        bucket=s3_bucket,
         key="testing",
         secret="testing",
         region_name=REGION,
@@ -57,9 +60,10 @@ def s3_backend(moto_server: str) -> Iterator[Backend]:
     )
     yield backend
     backend.close()
+    cleanup_bucket(s3_admin_client, s3_bucket)
 
 
-# region: Construction (S3-001 through S3-005)
+# region: Construction (S3-001 through S3-005, S3-021, S3-022)
 class TestS3Construction:
     """S3-001 through S3-005: construction and identity."""
 
@@ -79,6 +83,10 @@ class TestS3Construction:
         for cap in Capability:
             assert caps.supports(cap), f"Missing capability: {cap.value}"
 
+
+class TestS3ConstructionOffline:
+    """S3-004, S3-005, S3-021, S3-022: construction checks that need no S3 service."""
+
     @pytest.mark.spec("S3-004")
     def test_lazy_connection(self) -> None:
         """Construction must not make network calls."""
@@ -108,6 +116,27 @@ class TestS3Construction:
         with pytest.raises(ValueError, match="bucket"):
             S3Backend(bucket="   ")
 
+    @pytest.mark.spec("S3-021")
+    def test_client_options_accepted(self) -> None:
+        """client_options are accepted without error at construction."""
+        from remote_store.backends._s3 import S3Backend
+
+        backend = S3Backend(
+            bucket="any-bucket",
+            key="k",
+            secret="s",
+            client_options={"connect_timeout": 5, "read_timeout": 10},
+        )
+        assert backend.name == "s3"
+
+    @pytest.mark.spec("S3-022")
+    def test_credentials_optional(self) -> None:
+        """Backend can be constructed without explicit credentials."""
+        from remote_store.backends._s3 import S3Backend
+
+        backend = S3Backend(bucket="any-bucket")
+        assert backend.name == "s3"
+
 
 # endregion
 
@@ -345,35 +374,6 @@ class TestS3Lifecycle:
 # endregion
 
 
-# region: Configuration (S3-021, S3-022)
-class TestS3Configuration:
-    """S3-021, S3-022: client options and credential chain."""
-
-    @pytest.mark.spec("S3-021")
-    def test_client_options_accepted(self) -> None:
-        """client_options are accepted without error at construction."""
-        from remote_store.backends._s3 import S3Backend
-
-        backend = S3Backend(
-            bucket="any-bucket",
-            key="k",
-            secret="s",
-            client_options={"connect_timeout": 5, "read_timeout": 10},
-        )
-        assert backend.name == "s3"
-
-    @pytest.mark.spec("S3-022")
-    def test_credentials_optional(self) -> None:
-        """Backend can be constructed without explicit credentials."""
-        from remote_store.backends._s3 import S3Backend
-
-        backend = S3Backend(bucket="any-bucket")
-        assert backend.name == "s3"
-
-
-# endregion
-
-
 # region: Read/Write roundtrip
 class TestS3ReadWrite:
     """Basic read/write roundtrip to verify full stack."""
@@ -6,8 +6,11 @@ All tests are skipped if dependencies are not installed.
 
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING
+import io
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -15,7 +18,11 @@ import pytest
 pytest.importorskip("moto", reason="moto not installed")
 pytest.importorskip("s3fs", reason="s3fs not installed")
 pytest.importorskip("pyarrow", reason="pyarrow not installed")
-boto3 = pytest.importorskip("boto3", reason="boto3 not installed")
+pytest.importorskip("boto3", reason="boto3 not installed")
+
+import s3fs  # noqa: E402
+from botocore.exceptions import ClientError  # noqa: E402
+from pyarrow.fs import S3FileSystem as PyArrowS3  # noqa: E402
 
 from remote_store._capabilities import Capability, CapabilitySet  # noqa: E402
 from remote_store._errors import (  # noqa: E402
@@ -25,6 +32,8 @@ from remote_store._errors import (  # noqa: E402
     RemoteStoreError,
 )
 from remote_store._models import FileInfo, FolderInfo  # noqa: E402
+from remote_store.backends._s3_pyarrow import S3PyArrowBackend  # noqa: E402
+from tests.backends.s3_helpers import cleanup_bucket  # noqa: E402
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -34,23 +43,35 @@ if TYPE_CHECKING:
 REGION = "us-east-1"
 
 
-@pytest.fixture()
-def s3pa_backend(moto_server: str) -> Iterator[Backend]:
-    """Create an S3PyArrowBackend against moto's mock S3 service."""
-    bucket = f"test-pa-{uuid.uuid4().hex[:8]}"
-    client = boto3.client(
-        "s3",
-        endpoint_url=moto_server,
-        aws_access_key_id="testing",
-        aws_secret_access_key="testing",
-        region_name=REGION,
-    )
-    client.create_bucket(Bucket=bucket)
+def _write_all(backend: Backend, files: dict[str, bytes]) -> None:
+    """Write *files* concurrently; each PUT is an independent round-trip to moto."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda item: backend.write(*item), files.items()))
 
-    from remote_store.backends._s3_pyarrow import S3PyArrowBackend
 
+def _ensure_bucket(client: Any, bucket: str) -> None:
+    """Create *bucket* unless a ``HeadBucket`` call finds it already there."""
+    try:
+        client.head_bucket(Bucket=bucket)
+    except ClientError as exc:
+        if exc.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+            raise
+        client.create_bucket(Bucket=bucket)
+
+
+@pytest.fixture(scope="module")
+def s3pa_bucket(s3_admin_client: Any) -> str:
+    """One bucket shared by every test in this module, named per pytest-xdist worker."""
+    bucket = f"test-pa-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+    _ensure_bucket(s3_admin_client, bucket)
+    cleanup_bucket(s3_admin_client, bucket)
+    return bucket
+
+
+@pytest.fixture(scope="module")
+def _s3pa_shared_backend(moto_server: str, s3pa_bucket: str) -> Iterator[Backend]:
     backend = S3PyArrowBackend(
-        bucket=bucket,
+        bucket=s3pa_bucket,
         key="testing",
         secret="testing",
         region_name=REGION,
@@ -60,31 +81,49 @@ def s3pa_backend(moto_server: str) -> Iterator[Backend]:
     backend.close()
 
 
+@pytest.fixture(scope="module")
+def readonly_s3pa_backend(_s3pa_shared_backend: Backend) -> Backend:
+    """The shared backend without per-test bucket cleanup, for tests that never touch objects."""
+    return _s3pa_shared_backend
+
+
+@pytest.fixture()
+def s3pa_backend(_s3pa_shared_backend: Backend, s3_admin_client: Any, s3pa_bucket: str) -> Iterator[Backend]:
+    """Module-wide S3PyArrowBackend against moto's mock S3 service.
+
+    The bucket is emptied and the s3fs listing cache dropped after each test,
+    so every test still starts from an empty bucket.
+    """
+    yield _s3pa_shared_backend
+    cleanup_bucket(s3_admin_client, s3pa_bucket)
+    _s3pa_shared_backend.unwrap(s3fs.S3FileSystem).invalidate_cache()
+
+
 # region: Construction (S3PA-001 through S3PA-005)
 class TestS3PyArrowConstruction:
     """S3PA-001 through S3PA-005: construction and identity."""
 
     @pytest.mark.spec("S3PA-001")
-    def test_constructor_minimal(self, s3pa_backend: Backend) -> None:
+    def test_constructor_minimal(self) -> None:
         """Backend can be constructed with bucket and credentials."""
-        assert s3pa_backend is not None
+        backend = S3PyArrowBackend(bucket="any-bucket", key="k", secret="s")
+        assert backend is not None
 
     @pytest.mark.spec("S3PA-002")
-    def test_name_is_s3_pyarrow(self, s3pa_backend: Backend) -> None:
-        assert s3pa_backend.name == "s3-pyarrow"
+    def test_name_is_s3_pyarrow(self, readonly_s3pa_backend: Backend) -> None:
+        assert readonly_s3pa_backend.name == "s3-pyarrow"
 
     @pytest.mark.spec("S3PA-003")
-    def test_declares_all_capabilities(self, s3pa_backend: Backend) -> None:
-        caps = s3pa_backend.capabilities
+    def test_declares_all_capabilities(self, readonly_s3pa_backend: Backend) -> None:
+        caps = readonly_s3pa_backend.capabilities
         assert isinstance(caps, CapabilitySet)
-        for cap in Capability:
-            assert caps.supports(cap), f"Missing capability: {cap.value}"
+        missing = frozenset(Capability) - frozenset(caps)
+        assert not missing, f"Missing capabilities: {sorted(c.value for c in missing)}"
 
     @pytest.mark.spec("S3PA-004")
-    def test_lazy_connection(self) -> None:
+    def test_lazy_connection(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Construction must not make network calls."""
-        from remote_store.backends._s3_pyarrow import S3PyArrowBackend
-
+        monkeypatch.setattr(socket, "socket", lambda *a, **k: pytest.fail("network call during construction"))
         backend = S3PyArrowBackend(
             bucket="any-bucket",
             endpoint_url="http://localhost:99999",
@@ -94,18 +133,10 @@ class TestS3PyArrowConstruction:
         assert backend.name == "s3-pyarrow"
 
     @pytest.mark.spec("S3PA-005")
-    def test_empty_bucket_raises(self) -> None:
-        from remote_store.backends._s3_pyarrow import S3PyArrowBackend
-
+    @pytest.mark.parametrize("bucket", ["", "   "], ids=["empty", "whitespace"])
+    def test_invalid_bucket_raises(self, bucket: str) -> None:
         with pytest.raises(ValueError, match="bucket"):
-            S3PyArrowBackend(bucket="")
-
-    @pytest.mark.spec("S3PA-005")
-    def test_whitespace_bucket_raises(self) -> None:
-        from remote_store.backends._s3_pyarrow import S3PyArrowBackend
-
-        with pytest.raises(ValueError, match="bucket"):
-            S3PyArrowBackend(bucket="   ")
+            S3PyArrowBackend(bucket=bucket)
 
 
 # endregion
@@ -188,8 +219,7 @@ class TestS3PyArrowDeleteFolder:
 
     @pytest.mark.spec("S3PA-016")
     def test_delete_folder_recursive(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.write("rf/a.txt", b"a")
-        s3pa_backend.write("rf/sub/b.txt", b"b")
+        _write_all(s3pa_backend, {"rf/a.txt": b"a", "rf/sub/b.txt": b"b"})
         s3pa_backend.delete_folder("rf", recursive=True)
         assert s3pa_backend.exists("rf/a.txt") is False
         assert s3pa_backend.exists("rf/sub/b.txt") is False
@@ -216,6 +246,12 @@ class TestS3PyArrowDeleteFolder:
             s3pa_backend.delete_folder("nonempty", recursive=False)
 
 
+_MOVE_COPY_OPS = [
+    pytest.param("move", marks=pytest.mark.spec("S3PA-015")),
+    pytest.param("copy", marks=pytest.mark.spec("S3PA-014")),
+]
+
+
 class TestS3PyArrowMoveCopy:
     """S3PA-014, S3PA-015: move and copy operations."""
 
@@ -226,18 +262,6 @@ class TestS3PyArrowMoveCopy:
         assert s3pa_backend.exists("src.txt") is False
         assert s3pa_backend.read_bytes("dst.txt") == b"data"
 
-    @pytest.mark.spec("S3PA-015")
-    def test_move_not_found(self, s3pa_backend: Backend) -> None:
-        with pytest.raises(NotFound):
-            s3pa_backend.move("missing.txt", "dst.txt")
-
-    @pytest.mark.spec("S3PA-015")
-    def test_move_already_exists(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.write("m1.txt", b"a")
-        s3pa_backend.write("m2.txt", b"b")
-        with pytest.raises(AlreadyExists):
-            s3pa_backend.move("m1.txt", "m2.txt", overwrite=False)
-
     @pytest.mark.spec("S3PA-015")
     def test_move_overwrite(self, s3pa_backend: Backend) -> None:
         s3pa_backend.write("mo1.txt", b"a")
@@ -253,17 +277,17 @@ class TestS3PyArrowMoveCopy:
         assert s3pa_backend.read_bytes("orig.txt") == b"data"
         assert s3pa_backend.read_bytes("clone.txt") == b"data"
 
-    @pytest.mark.spec("S3PA-014")
-    def test_copy_not_found(self, s3pa_backend: Backend) -> None:
+    @pytest.mark.parametrize("op", _MOVE_COPY_OPS)
+    def test_source_not_found(self, s3pa_backend: Backend, op: str) -> None:
         with pytest.raises(NotFound):
-            s3pa_backend.copy("missing.txt", "dst.txt")
+            getattr(s3pa_backend, op)("missing.txt", "dst.txt")
 
-    @pytest.mark.spec("S3PA-014")
-    def test_copy_already_exists(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.write("c1.txt", b"a")
-        s3pa_backend.write("c2.txt", b"b")
+    @pytest.mark.parametrize("op", _MOVE_COPY_OPS)
+    def test_destination_already_exists(self, s3pa_backend: Backend, op: str) -> None:
+        s3pa_backend.write("a.txt", b"a")
+        s3pa_backend.write("b.txt", b"b")
         with pytest.raises(AlreadyExists):
-            s3pa_backend.copy("c1.txt", "c2.txt", overwrite=False)
+            getattr(s3pa_backend, op)("a.txt", "b.txt", overwrite=False)
 
     @pytest.mark.spec("S3PA-014")
     def test_copy_overwrite(self, s3pa_backend: Backend) -> None:
@@ -318,32 +342,31 @@ class TestS3PyArrowLifecycle:
     """S3PA-020, S3PA-021: close and unwrap."""
 
     @pytest.mark.spec("S3PA-020")
-    def test_close_is_callable(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.close()
+    def test_close_is_callable(self) -> None:
+        S3PyArrowBackend(bucket="any-bucket").close()
 
     @pytest.mark.spec("S3PA-020")
-    def test_close_idempotent(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.close()
-        s3pa_backend.close()
+    def test_close_idempotent(self) -> None:
+        """close() can be called more than once without error."""
+        # A private backend, so closing it leaves the shared module backend connected.
+        backend = S3PyArrowBackend(bucket="any-bucket")
+        backend.close()
+        backend.close()
 
     @pytest.mark.spec("S3PA-021")
-    def test_unwrap_pyarrow(self, s3pa_backend: Backend) -> None:
-        from pyarrow.fs import S3FileSystem as PyArrowS3
-
-        fs = s3pa_backend.unwrap(PyArrowS3)
+    def test_unwrap_pyarrow(self, readonly_s3pa_backend: Backend) -> None:
+        fs = readonly_s3pa_backend.unwrap(PyArrowS3)
         assert isinstance(fs, PyArrowS3)
 
     @pytest.mark.spec("S3PA-021")
-    def test_unwrap_s3fs(self, s3pa_backend: Backend) -> None:
-        import s3fs
-
-        fs = s3pa_backend.unwrap(s3fs.S3FileSystem)
+    def test_unwrap_s3fs(self, readonly_s3pa_backend: Backend) -> None:
+        fs = readonly_s3pa_backend.unwrap(s3fs.S3FileSystem)
         assert isinstance(fs, s3fs.S3FileSystem)
 
     @pytest.mark.spec("S3PA-021")
-    def test_unwrap_wrong_type_raises(self, s3pa_backend: Backend) -> None:
+    def test_unwrap_wrong_type_raises(self, readonly_s3pa_backend: Backend) -> None:
         with pytest.raises(CapabilityNotSupported):
-            s3pa_backend.unwrap(str)
+            readonly_s3pa_backend.unwrap(str)
 
 
 # endregion
@@ -356,8 +379,6 @@ class TestS3PyArrowConfiguration:
     @pytest.mark.spec("S3PA-022")
     def test_client_options_accepted(self) -> None:
         """client_options are accepted without error at construction."""
-        from remote_store.backends._s3_pyarrow import S3PyArrowBackend
-
         backend = S3PyArrowBackend(
             bucket="any-bucket",
             key="k",
@@ -369,8 +390,6 @@ class TestS3PyArrowConfiguration:
     @pytest.mark.spec("S3PA-001")
     def test_credentials_optional(self) -> None:
         """Backend can be constructed without explicit credentials."""
-        from remote_store.backends._s3_pyarrow import S3PyArrowBackend
-
         backend = S3PyArrowBackend(bucket="any-bucket")
         assert backend.name == "s3-pyarrow"
 
@@ -406,8 +425,6 @@ class TestS3PyArrowReadWrite:
         assert s3pa_backend.read_bytes("a/b/c/deep.txt") == b"deep"
 
     def test_write_from_binaryio(self, s3pa_backend: Backend) -> None:
-        import io
-
         s3pa_backend.write("bio.txt", io.BytesIO(b"streamed"))
         assert s3pa_backend.read_bytes("bio.txt") == b"streamed"
 
@@ -423,31 +440,24 @@ class TestS3PyArrowListing:
         s3pa_backend.write("lst/a.txt", b"a")
         s3pa_backend.write("lst/b.txt", b"b")
         s3pa_backend.write("lst/sub/c.txt", b"c")
-        files = list(s3pa_backend.list_files("lst"))
-        names = {f.name for f in files}
+        names = {f.name for f in s3pa_backend.list_files("lst")}
         assert names == {"a.txt", "b.txt"}
 
     def test_list_files_recursive(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.write("lr/a.txt", b"a")
-        s3pa_backend.write("lr/sub/b.txt", b"b")
-        files = list(s3pa_backend.list_files("lr", recursive=True))
-        names = {f.name for f in files}
+        _write_all(s3pa_backend, {"lr/a.txt": b"a", "lr/sub/b.txt": b"b"})
+        names = {f.name for f in s3pa_backend.list_files("lr", recursive=True)}
         assert names == {"a.txt", "b.txt"}
 
     def test_list_files_empty_folder(self, s3pa_backend: Backend) -> None:
-        files = list(s3pa_backend.list_files("empty"))
-        assert files == []
+        assert list(s3pa_backend.list_files("empty")) == []
 
     def test_list_folders(self, s3pa_backend: Backend) -> None:
-        s3pa_backend.write("lf/sub1/a.txt", b"a")
-        s3pa_backend.write("lf/sub2/b.txt", b"b")
-        s3pa_backend.write("lf/root.txt", b"r")
+        _write_all(s3pa_backend, {"lf/sub1/a.txt": b"a", "lf/sub2/b.txt": b"b", "lf/root.txt": b"r"})
         folders = set(s3pa_backend.list_folders("lf"))
         assert folders == {"sub1", "sub2"}
 
     def test_list_folders_empty(self, s3pa_backend: Backend) -> None:
-        folders = list(s3pa_backend.list_folders("empty"))
-        assert folders == []
+        assert list(s3pa_backend.list_folders("empty")) == []
 
 
 class TestS3PyArrowMetadata:
@@ -6,7 +6,10 @@ All tests are skipped if dependencies are not installed.
 
 from __future__ import annotations
 
-import uuid
+import functools
+import io
+import itertools
+import posixpath
 from typing import TYPE_CHECKING
 
 import pytest
@@ -35,17 +38,19 @@ if TYPE_CHECKING:
     from remote_store._backend import Backend
 
 
-@pytest.fixture()
-def sftp_backend(sftp_server: tuple[int, str]) -> Iterator[Backend]:
-    """Create an SFTPBackend against the in-process SFTP server."""
-    port, host_key_entry = sftp_server
-    base_path = f"/test_{uuid.uuid4().hex[:8]}"
+# Per-test directories only need to be unique within this session's server.
+_base_path_counter = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def _shared_sftp_backend(sftp_server: tuple[int, str]) -> Iterator[SFTPBackend]:
+    """One SFTPBackend per session so the SSH handshake happens once."""
+    port, _host_key_entry = sftp_server
     backend = SFTPBackend(
         host="127.0.0.1",
         port=port,
         username="testuser",
         password="testpass",
-        base_path=base_path,
         host_key_policy=HostKeyPolicy.AUTO_ADD,
         connect_kwargs={"allow_agent": False, "look_for_keys": False},
     )
@@ -53,6 +58,39 @@ def sftp_backend(sftp_server: tuple[int, str]) -> Iterator[Backend]:
     backend.close()
 
 
+@pytest.fixture()
+def sftp_backend(_shared_sftp_backend: SFTPBackend) -> Iterator[Backend]:
+    """The shared SFTPBackend, rebased onto a fresh directory for each test.
+
+    The directory is removed on teardown. Tests that close the backend are
+    fine: the next operation reconnects lazily.
+    """
+    backend = _shared_sftp_backend
+    base_path = f"/test_{next(_base_path_counter):08x}"
+    backend._sftp.mkdir(base_path)
+    backend._base_path = base_path
+    yield backend
+    backend._base_path = "/"
+    backend.delete_folder(base_path.lstrip("/"), recursive=True, missing_ok=True)
+
+
+def _bulk_seed(backend: Backend, files: dict[str, bytes]) -> None:
+    """Seed *files* over the raw SFTP channel: one MKDIR per unique directory, no per-file STAT."""
+    assert isinstance(backend, SFTPBackend)
+    sftp = backend.unwrap(paramiko.SFTPClient)
+    remote = {backend._sftp_path(path): data for path, data in files.items()}
+    dirs: set[str] = set()
+    for native in remote:
+        parent = posixpath.dirname(native)
+        while parent not in ("", "/", backend._base_path):
+            dirs.add(parent)
+            parent = posixpath.dirname(parent)
+    for directory in sorted(dirs, key=lambda d: d.count("/")):
+        sftp.mkdir(directory)
+    for native, data in remote.items():
+        sftp.putfo(io.BytesIO(data), native, confirm=False)
+
+
 # region: Construction (SFTP-001 through SFTP-005)
 class TestSFTPConstruction:
     """SFTP-001 through SFTP-005: construction and identity."""
@@ -90,14 +128,10 @@ class TestSFTPConstruction:
         assert backend.name == "sftp"
 
     @pytest.mark.spec("SFTP-005")
-    def test_empty_host_raises(self) -> None:
+    @pytest.mark.parametrize("host", ["", "   "], ids=["empty", "whitespace"])
+    def test_invalid_host_raises(self, host: str) -> None:
         with pytest.raises(ValueError, match="host"):
-            SFTPBackend(host="")
-
-    @pytest.mark.spec("SFTP-005")
-    def test_whitespace_host_raises(self) -> None:
-        with pytest.raises(ValueError, match="host"):
-            SFTPBackend(host="   ")
+            SFTPBackend(host=host)
 
 
 # endregion
@@ -178,11 +212,11 @@ class TestSFTPAtomicWrite:
     @pytest.mark.spec("SFTP-014")
     def test_write_atomic_no_temp_file_left(self, sftp_backend: Backend) -> None:
         """After successful atomic write, no temp files should remain."""
+        assert isinstance(sftp_backend, SFTPBackend)
         sftp_backend.write_atomic("clean.txt", b"content")
-        # List files -- should only see the target, no .~tmp.* files
-        files = list(sftp_backend.list_files(""))
-        temp_files = [f for f in files if f.name.startswith(".~tmp.")]
-        assert temp_files == []
+        # The temp name is random, so check the raw directory entries: only the target may remain.
+        names = sftp_backend.unwrap(paramiko.SFTPClient).listdir(sftp_backend._sftp_path(""))
+        assert names == ["clean.txt"]
 
     @pytest.mark.spec("SFTP-015")
     def test_write_atomic_overwrite(self, sftp_backend: Backend) -> None:
@@ -206,8 +240,7 @@ class TestSFTPDeleteFolder:
 
     @pytest.mark.spec("SFTP-016")
     def test_delete_folder_recursive(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("rf/a.txt", b"a")
-        sftp_backend.write("rf/sub/b.txt", b"b")
+        _bulk_seed(sftp_backend, {"rf/a.txt": b"a", "rf/sub/b.txt": b"b"})
         sftp_backend.delete_folder("rf", recursive=True)
         assert sftp_backend.exists("rf/a.txt") is False
         assert sftp_backend.exists("rf/sub/b.txt") is False
@@ -229,7 +262,7 @@ class TestSFTPDeleteFolder:
 
     @pytest.mark.spec("SFTP-017")
     def test_delete_folder_non_recursive_non_empty(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("nonempty/file.txt", b"x")
+        _bulk_seed(sftp_backend, {"nonempty/file.txt": b"x"})
         with pytest.raises(RemoteStoreError):
             sftp_backend.delete_folder("nonempty", recursive=False)
 
@@ -243,7 +276,7 @@ class TestSFTPMoveCopy:
 
     @pytest.mark.spec("SFTP-018")
     def test_move(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("src.txt", b"data")
+        _bulk_seed(sftp_backend, {"src.txt": b"data"})
         sftp_backend.move("src.txt", "dst.txt")
         assert sftp_backend.exists("src.txt") is False
         assert sftp_backend.read_bytes("dst.txt") == b"data"
@@ -255,22 +288,20 @@ class TestSFTPMoveCopy:
 
     @pytest.mark.spec("SFTP-018")
     def test_move_already_exists(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("m1.txt", b"a")
-        sftp_backend.write("m2.txt", b"b")
+        _bulk_seed(sftp_backend, {"m1.txt": b"a", "m2.txt": b"b"})
         with pytest.raises(AlreadyExists):
             sftp_backend.move("m1.txt", "m2.txt", overwrite=False)
 
     @pytest.mark.spec("SFTP-018")
     def test_move_overwrite(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("mo1.txt", b"a")
-        sftp_backend.write("mo2.txt", b"b")
+        _bulk_seed(sftp_backend, {"mo1.txt": b"a", "mo2.txt": b"b"})
         sftp_backend.move("mo1.txt", "mo2.txt", overwrite=True)
         assert sftp_backend.read_bytes("mo2.txt") == b"a"
         assert sftp_backend.exists("mo1.txt") is False
 
     @pytest.mark.spec("SFTP-019")
     def test_copy(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("orig.txt", b"data")
+        _bulk_seed(sftp_backend, {"orig.txt": b"data"})
         sftp_backend.copy("orig.txt", "clone.txt")
         assert sftp_backend.read_bytes("orig.txt") == b"data"
         assert sftp_backend.read_bytes("clone.txt") == b"data"
@@ -282,15 +313,13 @@ class TestSFTPMoveCopy:
 
     @pytest.mark.spec("SFTP-019")
     def test_copy_already_exists(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("c1.txt", b"a")
-        sftp_backend.write("c2.txt", b"b")
+        _bulk_seed(sftp_backend, {"c1.txt": b"a", "c2.txt": b"b"})
         with pytest.raises(AlreadyExists):
             sftp_backend.copy("c1.txt", "c2.txt", overwrite=False)
 
     @pytest.mark.spec("SFTP-019")
     def test_copy_overwrite(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("co1.txt", b"a")
-        sftp_backend.write("co2.txt", b"b")
+        _bulk_seed(sftp_backend, {"co1.txt": b"a", "co2.txt": b"b"})
         sftp_backend.copy("co1.txt", "co2.txt", overwrite=True)
         assert sftp_backend.read_bytes("co2.txt") == b"a"
         assert sftp_backend.read_bytes("co1.txt") == b"a"
@@ -340,13 +369,15 @@ class TestSFTPLifecycle:
     """SFTP-025 through SFTP-027: close and unwrap."""
 
     @pytest.mark.spec("SFTP-025")
-    def test_close_is_callable(self, sftp_backend: Backend) -> None:
-        sftp_backend.close()
+    def test_close_is_callable(self) -> None:
+        SFTPBackend(host="dummy", host_key_policy=HostKeyPolicy.AUTO_ADD).close()
 
     @pytest.mark.spec("SFTP-027")
-    def test_close_idempotent(self, sftp_backend: Backend) -> None:
-        sftp_backend.close()
-        sftp_backend.close()
+    def test_close_idempotent(self) -> None:
+        """close() only resets local client state, so no server is needed."""
+        backend = SFTPBackend(host="dummy", host_key_policy=HostKeyPolicy.AUTO_ADD)
+        backend.close()
+        backend.close()
 
     @pytest.mark.spec("SFTP-026")
     def test_unwrap_sftp_client(self, sftp_backend: Backend) -> None:
@@ -379,16 +410,17 @@ class TestPEMSanitization:
         assert "\n" in result.split("-----")[2]
 
     @pytest.mark.spec("SFTP-008")
-    def test_sanitize_invalid_structure(self) -> None:
-        """PEM with wrong number of parts raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid PEM"):
-            _sanitize_pem("not-a-pem-string")
-
-    @pytest.mark.spec("SFTP-008")
-    def test_sanitize_multiple_non_base64_chars(self) -> None:
-        """PEM with multiple non-base64 separator types raises ValueError."""
-        pem = "-----BEGIN-----A B\tC-----END-----"
-        with pytest.raises(ValueError, match="Unexpected PEM"):
+    @pytest.mark.parametrize(
+        ("pem", "match"),
+        [
+            ("not-a-pem-string", "Invalid PEM"),
+            ("-----BEGIN-----A B\tC-----END-----", "Unexpected PEM"),
+        ],
+        ids=["invalid-structure", "multiple-non-base64-chars"],
+    )
+    def test_sanitize_rejects_malformed_pem(self, pem: str, match: str) -> None:
+        """Wrong number of parts, or mixed non-base64 separators, raise ValueError."""
+        with pytest.raises(ValueError, match=match):
             _sanitize_pem(pem)
 
 
@@ -396,21 +428,34 @@ class TestPEMSanitization:
 
 
 # region: Unit tests for helpers (no server needed)
+def _refuse_connect() -> None:
+    raise AssertionError("helper unit tests must not open an SFTP connection")
+
+
+@functools.cache
+def _dummy_backend(base_path: str) -> SFTPBackend:
+    """Unconnected backend, shared per base_path; any attempt to connect fails the test."""
+    backend = SFTPBackend(host="dummy", base_path=base_path, host_key_policy=HostKeyPolicy.AUTO_ADD)
+    backend._connect = _refuse_connect  # type: ignore[method-assign]
+    return backend
+
+
 class TestSFTPHelpers:
     """Unit tests for SFTPBackend helper methods -- no server needed."""
 
-    def test_sftp_path_with_base_path_root(self) -> None:
-        """_sftp_path with base_path='/' returns /<path>."""
-        backend = SFTPBackend(host="dummy", host_key_policy=HostKeyPolicy.AUTO_ADD)
-        assert backend._sftp_path("file.txt") == "/file.txt"
-        assert backend._sftp_path("a/b.txt") == "/a/b.txt"
-        assert backend._sftp_path("") == "/"
-
-    def test_sftp_path_with_base_path_subdir(self) -> None:
-        """_sftp_path with base_path='/data' returns /data/<path>."""
-        backend = SFTPBackend(host="dummy", base_path="/data", host_key_policy=HostKeyPolicy.AUTO_ADD)
-        assert backend._sftp_path("file.txt") == "/data/file.txt"
-        assert backend._sftp_path("") == "/data"
+    @pytest.mark.parametrize(
+        ("base_path", "path", "expected"),
+        [
+            ("/", "file.txt", "/file.txt"),
+            ("/", "a/b.txt", "/a/b.txt"),
+            ("/", "", "/"),
+            ("/data", "file.txt", "/data/file.txt"),
+            ("/data", "", "/data"),
+        ],
+    )
+    def test_sftp_path(self, base_path: str, path: str, expected: str) -> None:
+        """_sftp_path joins *path* onto base_path; the empty path maps to base_path itself."""
+        assert _dummy_backend(base_path)._sftp_path(path) == expected
 
     def test_resolve_host_keys_direct(self) -> None:
         """Direct known_host_keys takes precedence."""
@@ -428,8 +473,7 @@ class TestSFTPHelpers:
             st_size = 42
             st_mtime = None
 
-        backend = SFTPBackend(host="dummy", host_key_policy=HostKeyPolicy.AUTO_ADD)
-        fi = backend._stat_to_fileinfo("test.txt", FakeAttrs())
+        fi = _dummy_backend("/")._stat_to_fileinfo("test.txt", FakeAttrs())
         assert fi.name == "test.txt"
         assert fi.size == 42
         assert fi.modified_at is not None
@@ -466,11 +510,15 @@ class TestSFTPReadWrite:
         assert sftp_backend.read_bytes("a/b/c/deep.txt") == b"deep"
 
     def test_write_from_binaryio(self, sftp_backend: Backend) -> None:
-        import io
-
         sftp_backend.write("bio.txt", io.BytesIO(b"streamed"))
         assert sftp_backend.read_bytes("bio.txt") == b"streamed"
 
+    def test_write_multi_chunk_stream(self, sftp_backend: Backend) -> None:
+        """A streamed write spanning many chunks round-trips intact."""
+        payload = bytes(range(256)) * 1024
+        sftp_backend.write("big.bin", io.BytesIO(payload))
+        assert sftp_backend.read_bytes("big.bin") == payload
+
 
 # endregion
 
@@ -480,16 +528,13 @@ class TestSFTPListing:
     """File and folder listing operations."""
 
     def test_list_files_non_recursive(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("lst/a.txt", b"a")
-        sftp_backend.write("lst/b.txt", b"b")
-        sftp_backend.write("lst/sub/c.txt", b"c")
+        _bulk_seed(sftp_backend, {"lst/a.txt": b"a", "lst/b.txt": b"b", "lst/sub/c.txt": b"c"})
         files = list(sftp_backend.list_files("lst"))
         names = {f.name for f in files}
         assert names == {"a.txt", "b.txt"}
 
     def test_list_files_recursive(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("lr/a.txt", b"a")
-        sftp_backend.write("lr/sub/b.txt", b"b")
+        _bulk_seed(sftp_backend, {"lr/a.txt": b"a", "lr/sub/b.txt": b"b"})
         files = list(sftp_backend.list_files("lr", recursive=True))
         names = {f.name for f in files}
         assert names == {"a.txt", "b.txt"}
@@ -499,9 +544,7 @@ class TestSFTPListing:
         assert files == []
 
     def test_list_folders(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("lf/sub1/a.txt", b"a")
-        sftp_backend.write("lf/sub2/b.txt", b"b")
-        sftp_backend.write("lf/root.txt", b"r")
+        _bulk_seed(sftp_backend, {"lf/sub1/a.txt": b"a", "lf/sub2/b.txt": b"b", "lf/root.txt": b"r"})
         folders = set(sftp_backend.list_folders("lf"))
         assert folders == {"sub1", "sub2"}
 
@@ -514,7 +557,7 @@ class TestSFTPMetadata:
     """File and folder metadata operations."""
 
     def test_get_file_info(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("info.txt", b"hello world")
+        _bulk_seed(sftp_backend, {"info.txt": b"hello world"})
         fi = sftp_backend.get_file_info("info.txt")
         assert isinstance(fi, FileInfo)
         assert fi.name == "info.txt"
@@ -526,8 +569,7 @@ class TestSFTPMetadata:
             sftp_backend.get_file_info("missing.txt")
 
     def test_get_folder_info(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("fi/a.txt", b"aaa")
-        sftp_backend.write("fi/b.txt", b"bb")
+        _bulk_seed(sftp_backend, {"fi/a.txt": b"aaa", "fi/b.txt": b"bb"})
         fi = sftp_backend.get_folder_info("fi")
         assert isinstance(fi, FolderInfo)
         assert fi.file_count == 2
@@ -538,19 +580,19 @@ class TestSFTPMetadata:
             sftp_backend.get_folder_info("nodir")
 
     def test_exists_file(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("e.txt", b"x")
+        _bulk_seed(sftp_backend, {"e.txt": b"x"})
         assert sftp_backend.exists("e.txt") is True
 
     def test_exists_missing(self, sftp_backend: Backend) -> None:
         assert sftp_backend.exists("nope.txt") is False
 
     def test_is_file(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("f.txt", b"x")
+        _bulk_seed(sftp_backend, {"f.txt": b"x"})
         assert sftp_backend.is_file("f.txt") is True
         assert sftp_backend.is_file("missing.txt") is False
 
     def test_is_file_not_folder(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("dir/f.txt", b"x")
+        _bulk_seed(sftp_backend, {"dir/f.txt": b"x"})
         assert sftp_backend.is_file("dir") is False
 
 
@@ -558,7 +600,7 @@ class TestSFTPDelete:
     """Delete operations."""
 
     def test_delete_file(self, sftp_backend: Backend) -> None:
-        sftp_backend.write("del.txt", b"x")
+        _bulk_seed(sftp_backend, {"del.txt": b"x"})
         sftp_backend.delete("del.txt")
         assert sftp_backend.exists("del.txt") is False
 
@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import pytest
+
+from remote_store._store import Store
+from remote_store.backends._local import LocalBackend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def pytest_configure(config: object) -> None:
     """Register custom markers."""
-    import pytest
-
     if isinstance(config, pytest.Config):
         config.addinivalue_line("markers", "spec(id): links test to a spec section ID")
         config.addinivalue_line("markers", "integration: requires external services")
+
+
+@pytest.fixture()
+def local_backend(tmp_path: Path) -> LocalBackend:
+    """LocalBackend rooted in pytest's per-test ``tmp_path``."""
+    return LocalBackend(root=str(tmp_path))
+
+
+@pytest.fixture()
+def store(local_backend: LocalBackend) -> Store:
+    """Store with ``root_path="data"`` on a fresh LocalBackend."""
+    return Store(backend=local_backend, root_path="data")
+
+
+@pytest.fixture()
+def store_no_root(local_backend: LocalBackend) -> Store:
+    """Store with an empty ``root_path`` on a fresh LocalBackend."""
+    return Store(backend=local_backend, root_path="")
@@ -7,26 +7,31 @@ import pytest
 from remote_store._capabilities import Capability, CapabilitySet
 from remote_store._errors import CapabilityNotSupported
 
+_EXPECTED_NAMES = frozenset(
+    {
+        "READ",
+        "WRITE",
+        "DELETE",
+        "LIST",
+        "MOVE",
+        "COPY",
+        "ATOMIC_WRITE",
+        "GLOB",
+        "RECURSIVE_LIST",
+        "METADATA",
+    }
+)
+
+# Shared by tests that only query it; safe because CapabilitySet is immutable (CAP-006).
+_CS_READ = CapabilitySet({Capability.READ})
+
 
 class TestCapabilityEnum:
     """CAP-001: Capability enum members."""
 
     @pytest.mark.spec("CAP-001")
     def test_members(self) -> None:
-        expected = {
-            "READ",
-            "WRITE",
-            "DELETE",
-            "LIST",
-            "MOVE",
-            "COPY",
-            "ATOMIC_WRITE",
-            "GLOB",
-            "RECURSIVE_LIST",
-            "METADATA",
-        }
-        actual = {c.name for c in Capability}
-        assert actual == expected
+        assert frozenset(c.name for c in Capability) == _EXPECTED_NAMES
 
 
 class TestCapabilitySetConstruction:
@@ -42,14 +47,9 @@ class TestCapabilitySetSupports:
     """CAP-003: supports() method."""
 
     @pytest.mark.spec("CAP-003")
-    def test_supports_true(self) -> None:
-        cs = CapabilitySet({Capability.READ})
-        assert cs.supports(Capability.READ) is True
-
-    @pytest.mark.spec("CAP-003")
-    def test_supports_false(self) -> None:
-        cs = CapabilitySet({Capability.READ})
-        assert cs.supports(Capability.WRITE) is False
+    @pytest.mark.parametrize(("cap", "expected"), [(Capability.READ, True), (Capability.WRITE, False)])
+    def test_supports(self, cap: Capability, expected: bool) -> None:
+        assert _CS_READ.supports(cap) is expected
 
 
 class TestCapabilitySetRequire:
@@ -57,14 +57,12 @@ class TestCapabilitySetRequire:
 
     @pytest.mark.spec("CAP-004")
     def test_require_passes(self) -> None:
-        cs = CapabilitySet({Capability.READ})
-        cs.require(Capability.READ)
+        _CS_READ.require(Capability.READ)
 
     @pytest.mark.spec("CAP-004")
     def test_require_raises(self) -> None:
-        cs = CapabilitySet({Capability.READ})
         with pytest.raises(CapabilityNotSupported) as exc_info:
-            cs.require(Capability.WRITE, backend="test")
+            _CS_READ.require(Capability.WRITE, backend="test")
         assert exc_info.value.capability == "write"
 
 
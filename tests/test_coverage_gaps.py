@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import os
-import tempfile
+import types
 from datetime import datetime, timezone
-from unittest.mock import patch
+from typing import IO, TYPE_CHECKING, NoReturn
 
 import pytest
 
@@ -25,7 +25,13 @@ from remote_store._store import Store
 from remote_store._types import Extras, PathLike, WritableContent
 from remote_store.backends._local import LocalBackend
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
 NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PATH_A = RemotePath("a.txt")
+PATH_DATA = RemotePath("data")
 
 
 # region: _types.py — verify type aliases are importable and usable
@@ -49,123 +55,57 @@ class TestTypeAliases:
 class TestStoreRepr:
     """Store.__repr__ for debugging."""
 
-    def test_repr(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            r = repr(store)
-            assert "Store(" in r
-            assert "local" in r
-            assert "data" in r
+    def test_repr(self, store: Store) -> None:
+        r = repr(store)
+        assert "Store(" in r
+        assert "local" in r
+        assert "data" in r
 
-    def test_repr_no_root(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend)
-            assert "root_path=''" in repr(store)
+    def test_repr_no_root(self, store_no_root: Store) -> None:
+        assert "root_path=''" in repr(store_no_root)
 
 
 class TestStoreEmptyPathNoRoot:
     """Store with no root_path handles empty path correctly."""
 
-    def test_full_path_empty_no_root(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="")
-            store.write("a.txt", b"data")
-            assert store.exists("")
-            assert store.is_folder("")
-            assert list(store.list_files("")) != []
+    def test_full_path_empty_no_root(self, store_no_root: Store) -> None:
+        store_no_root.write("a.txt", b"data")
+        assert store_no_root.exists("")
+        assert store_no_root.is_folder("")
+        assert list(store_no_root.list_files("")) != []
 
-    def test_full_path_nonempty_no_root(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="")
-            store.write("sub/a.txt", b"data")
-            assert store.exists("sub/a.txt")
+    def test_full_path_nonempty_no_root(self, store_no_root: Store) -> None:
+        store_no_root.write("sub/a.txt", b"data")
+        assert store_no_root.exists("sub/a.txt")
 
 
 class TestStoreEmptyPathRejection:
     """File-targeted methods reject empty path."""
 
-    def test_write_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.write("", b"data")
-
-    def test_write_atomic_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.write_atomic("", b"data")
-
-    def test_read_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.read("")
-
-    def test_read_bytes_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.read_bytes("")
-
-    def test_delete_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.delete("")
-
-    def test_delete_folder_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.delete_folder("")
-
-    def test_get_file_info_empty_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.get_file_info("")
-
-    def test_move_empty_src(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.move("", "dst.txt")
-
-    def test_move_empty_dst(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            store.write("src.txt", b"data")
-            with pytest.raises(InvalidPath):
-                store.move("src.txt", "")
-
-    def test_copy_empty_src(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.copy("", "dst.txt")
-
-    def test_copy_empty_dst(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            store.write("src.txt", b"data")
-            with pytest.raises(InvalidPath):
-                store.copy("src.txt", "")
+    @pytest.mark.parametrize(
+        "op",
+        [
+            lambda s: s.write("", b"data"),
+            lambda s: s.write_atomic("", b"data"),
+            lambda s: s.read(""),
+            lambda s: s.read_bytes(""),
+            lambda s: s.delete(""),
+            lambda s: s.delete_folder(""),
+            lambda s: s.get_file_info(""),
+            lambda s: s.move("", "dst.txt"),
+            lambda s: s.copy("", "dst.txt"),
+        ],
+        ids=["write", "write_atomic", "read", "read_bytes", "delete", "delete_folder", "get_file_info", "move", "copy"],
+    )
+    def test_empty_path_rejected(self, store: Store, op: Callable[[Store], object]) -> None:
+        with pytest.raises(InvalidPath):
+            op(store)
+
+    @pytest.mark.parametrize("method", ["move", "copy"])
+    def test_empty_destination_rejected(self, store: Store, method: str) -> None:
+        store.write("src.txt", b"data")
+        with pytest.raises(InvalidPath):
+            getattr(store, method)("src.txt", "")
 
 
 # endregion
@@ -241,24 +181,24 @@ class TestModelEqualityNotImplemented:
     """Cover __eq__ returning NotImplemented for non-model types."""
 
     def test_fileinfo_neq_non_fileinfo(self) -> None:
-        fi = FileInfo(path=RemotePath("a.txt"), name="a.txt", size=10, modified_at=NOW)
+        fi = FileInfo(path=PATH_A, name="a.txt", size=10, modified_at=NOW)
         assert fi != "not a FileInfo"
 
     def test_folderinfo_neq_non_folderinfo(self) -> None:
-        fi = FolderInfo(path=RemotePath("data"), file_count=1, total_size=10)
+        fi = FolderInfo(path=PATH_DATA, file_count=1, total_size=10)
         assert fi != "not a FolderInfo"
 
     def test_folderinfo_hash(self) -> None:
-        a = FolderInfo(path=RemotePath("data"), file_count=1, total_size=10)
-        b = FolderInfo(path=RemotePath("data"), file_count=9, total_size=99)
+        a = FolderInfo(path=PATH_DATA, file_count=1, total_size=10)
+        b = FolderInfo(path=PATH_DATA, file_count=9, total_size=99)
         assert hash(a) == hash(b)
 
     def test_remotefile_neq_non_remotefile(self) -> None:
-        rf = RemoteFile(path=RemotePath("a.txt"))
+        rf = RemoteFile(path=PATH_A)
         assert rf != "not a RemoteFile"
 
     def test_remotefolder_neq_non_remotefolder(self) -> None:
-        rf = RemoteFolder(path=RemotePath("data"))
+        rf = RemoteFolder(path=PATH_DATA)
         assert rf != 42
 
 
@@ -284,18 +224,17 @@ class TestCapabilitySetRepr:
 class TestRegistryRepr:
     """Registry.__repr__ for debugging."""
 
-    def test_repr(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            config = RegistryConfig.from_dict(
-                {
-                    "backends": {"local": {"type": "local", "options": {"root": tmp}}},
-                    "stores": {"data": {"backend": "local", "root_path": "data"}},
-                }
-            )
-            reg = Registry(config)
-            r = repr(reg)
-            assert "Registry(" in r
-            assert "data" in r
+    def test_repr(self, tmp_path: Path) -> None:
+        config = RegistryConfig.from_dict(
+            {
+                "backends": {"local": {"type": "local", "options": {"root": str(tmp_path)}}},
+                "stores": {"data": {"backend": "local", "root_path": "data"}},
+            }
+        )
+        reg = Registry(config)
+        r = repr(reg)
+        assert "Registry(" in r
+        assert "data" in r
 
 
 class TestRegistryUnknownBackendType:
@@ -317,149 +256,116 @@ class TestRegistryUnknownBackendType:
 
 
 # region: _local.py — delete_folder edge cases, _is_fd_closed, non-dir errors
+@pytest.fixture(scope="module")
+def shared_backend(tmp_path_factory: pytest.TempPathFactory) -> LocalBackend:
+    """One LocalBackend for the module; each test below uses its own file names."""
+    return LocalBackend(root=str(tmp_path_factory.mktemp("local_edge_cases")))
+
+
 class TestLocalBackendDeleteFolderEdgeCases:
     """Cover delete_folder edge cases."""
 
-    def test_delete_non_empty_folder_non_recursive(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("folder/file.txt", b"data")
-            with pytest.raises(NotFound, match="not empty"):
-                backend.delete_folder("folder", recursive=False)
+    def test_delete_non_empty_folder_non_recursive(self, shared_backend: LocalBackend) -> None:
+        shared_backend.write("nonempty/file.txt", b"data")
+        with pytest.raises(NotFound, match="not empty"):
+            shared_backend.delete_folder("nonempty", recursive=False)
 
-    def test_delete_folder_path_is_file(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("file.txt", b"data")
-            with pytest.raises(NotFound, match="Not a folder"):
-                backend.delete_folder("file.txt")
+    def test_delete_folder_path_is_file(self, shared_backend: LocalBackend) -> None:
+        shared_backend.write("plain_file.txt", b"data")
+        with pytest.raises(NotFound, match="Not a folder"):
+            shared_backend.delete_folder("plain_file.txt")
 
 
 class TestLocalBackendListEdgeCases:
     """Cover listing on non-directory paths."""
 
-    def test_list_files_on_nonexistent_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            assert list(backend.list_files("nonexistent")) == []
+    def test_list_files_on_nonexistent_path(self, shared_backend: LocalBackend) -> None:
+        assert list(shared_backend.list_files("nonexistent")) == []
 
-    def test_list_folders_on_nonexistent_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            assert list(backend.list_folders("nonexistent")) == []
+    def test_list_folders_on_nonexistent_path(self, shared_backend: LocalBackend) -> None:
+        assert list(shared_backend.list_folders("nonexistent")) == []
+
+
+def _raiser(exc: BaseException) -> Callable[..., NoReturn]:
+    def _raise(*args: object, **kwargs: object) -> NoReturn:
+        raise exc
+
+    return _raise
 
 
 class TestLocalBackendPermissionErrors:
     """Cover PermissionError mapping via mocking."""
 
-    def test_read_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("secret.txt", b"data")
-            with (
-                patch("builtins.open", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.read("secret.txt")
-
-    def test_read_bytes_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("secret.txt", b"data")
-            with (
-                patch("pathlib.Path.read_bytes", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.read_bytes("secret.txt")
-
-    def test_write_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with (
-                patch("pathlib.Path.write_bytes", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.write("test.txt", b"data")
-
-    def test_delete_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("file.txt", b"data")
-            with (
-                patch("pathlib.Path.unlink", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.delete("file.txt")
-
-    def test_move_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("src.txt", b"data")
-            with (
-                patch("shutil.move", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.move("src.txt", "dst.txt")
-
-    def test_copy_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("src.txt", b"data")
-            with (
-                patch("shutil.copy2", side_effect=PermissionError("denied")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.copy("src.txt", "dst.txt")
-
-    def test_delete_folder_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            backend.write("folder/file.txt", b"data")
-            backend.delete("folder/file.txt")
-            with (
-                patch("pathlib.Path.rmdir", side_effect=OSError("permission error")),
-                pytest.raises(PermissionDenied),
-            ):
-                backend.delete_folder("folder", recursive=False)
+    @pytest.mark.parametrize(
+        ("target", "method", "args"),
+        [
+            ("builtins.open", "read", ("secret.txt",)),
+            ("pathlib.Path.read_bytes", "read_bytes", ("secret.txt",)),
+            ("pathlib.Path.write_bytes", "write", ("denied_write.txt", b"data")),
+            ("pathlib.Path.unlink", "delete", ("secret.txt",)),
+            ("shutil.move", "move", ("secret.txt", "denied_dst.txt")),
+            ("shutil.copy2", "copy", ("secret.txt", "denied_dst.txt")),
+        ],
+        ids=["read", "read_bytes", "write", "delete", "move", "copy"],
+    )
+    def test_permission_denied(
+        self,
+        shared_backend: LocalBackend,
+        monkeypatch: pytest.MonkeyPatch,
+        target: str,
+        method: str,
+        args: tuple[object, ...],
+    ) -> None:
+        shared_backend.write("secret.txt", b"data", overwrite=True)
+        with monkeypatch.context() as m, pytest.raises(PermissionDenied):
+            m.setattr(target, _raiser(PermissionError("denied")))
+            getattr(shared_backend, method)(*args)
+
+    def test_delete_folder_permission_denied(
+        self, shared_backend: LocalBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        shared_backend.write("denied_folder/file.txt", b"data")
+        shared_backend.delete("denied_folder/file.txt")
+        with monkeypatch.context() as m, pytest.raises(PermissionDenied):
+            m.setattr("pathlib.Path.rmdir", _raiser(OSError("permission error")))
+            shared_backend.delete_folder("denied_folder", recursive=False)
+
+
+def _disk_full_write(self: IO[bytes], data: bytes) -> int:
+    raise OSError("disk full")
 
 
 class TestLocalBackendWriteAtomicCleanup:
     """Cover write_atomic error handling paths."""
 
-    def test_write_atomic_cleanup_on_failure(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            original_fdopen = os.fdopen
-
-            def failing_fdopen(fd, mode="r"):
-                f = original_fdopen(fd, mode)
-
-                def bad_write(data: bytes) -> int:
-                    raise OSError("disk full")
+    def test_write_atomic_cleanup_on_failure(
+        self, local_backend: LocalBackend, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        real_fdopen = os.fdopen
 
-                f.write = bad_write
-                return f
+        def failing_fdopen(fd: int, mode: str = "r") -> IO[bytes]:
+            f = real_fdopen(fd, mode)
+            f.write = types.MethodType(_disk_full_write, f)
+            return f
 
-            with patch("os.fdopen", side_effect=failing_fdopen), pytest.raises(OSError, match="disk full"):
-                backend.write_atomic("test.txt", b"data")
-            # Temp file should be cleaned up
-            assert not backend.exists("test.txt")
+        monkeypatch.setattr(os, "fdopen", failing_fdopen)
+        with pytest.raises(OSError, match="disk full"):
+            local_backend.write_atomic("test.txt", b"data")
+        # Neither the target nor the temp file should be left behind
+        assert list(tmp_path.iterdir()) == []
 
-    def test_write_atomic_permission_denied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with patch("tempfile.mkstemp", side_effect=PermissionError("denied")), pytest.raises(PermissionDenied):
-                backend.write_atomic("test.txt", b"data")
+    def test_write_atomic_permission_denied(self, local_backend: LocalBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("tempfile.mkstemp", _raiser(PermissionError("denied")))
+        with pytest.raises(PermissionDenied):
+            local_backend.write_atomic("test.txt", b"data")
 
 
 class TestLocalBackendUnwrap:
     """Cover Backend.unwrap() default implementation."""
 
-    def test_unwrap_raises(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with pytest.raises(CapabilityNotSupported, match="unwrap"):
-                backend.unwrap(dict)
+    def test_unwrap_raises(self, local_backend: LocalBackend) -> None:
+        with pytest.raises(CapabilityNotSupported, match="unwrap"):
+            local_backend.unwrap(dict)
 
 
 # endregion
@@ -487,69 +393,51 @@ class TestRemotePathImmutability:
 class TestStoreContextManager:
     """Store supports close() and context manager protocol."""
 
-    def test_close(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            store.close()  # should not raise
+    def test_close(self, store: Store) -> None:
+        store.close()  # should not raise
 
-    def test_context_manager(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with Store(backend=backend, root_path="data") as store:
-                store.write("a.txt", b"data")
-                assert store.exists("a.txt")
+    def test_context_manager(self, local_backend: LocalBackend) -> None:
+        with Store(backend=local_backend, root_path="data") as store:
+            store.write("a.txt", b"data")
+            assert store.exists("a.txt")
 
 
 class TestStoreRootPathValidation:
     """Store constructor validates root_path."""
 
-    def test_root_path_with_dotdot_rejected(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with pytest.raises(InvalidPath, match="\\.\\."):
-                Store(backend=backend, root_path="../escape")
+    def test_root_path_with_dotdot_rejected(self, local_backend: LocalBackend) -> None:
+        with pytest.raises(InvalidPath, match="\\.\\."):
+            Store(backend=local_backend, root_path="../escape")
 
-    def test_root_path_with_null_byte_rejected(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            with pytest.raises(InvalidPath, match="null"):
-                Store(backend=backend, root_path="bad\0path")
+    def test_root_path_with_null_byte_rejected(self, local_backend: LocalBackend) -> None:
+        with pytest.raises(InvalidPath, match="null"):
+            Store(backend=local_backend, root_path="bad\0path")
 
-    def test_root_path_normalized(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="a//b/./c")
-            assert store._root == "a/b/c"
+    def test_root_path_normalized(self, local_backend: LocalBackend) -> None:
+        store = Store(backend=local_backend, root_path="a//b/./c")
+        assert store._root == "a/b/c"
 
 
 class TestStoreEquality:
     """Store __eq__ and __hash__."""
 
-    def test_same_store_equal(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            a = Store(backend=backend, root_path="data")
-            b = Store(backend=backend, root_path="data")
-            assert a == b
-
-    def test_different_root_not_equal(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            a = Store(backend=backend, root_path="data")
-            b = Store(backend=backend, root_path="other")
-            assert a != b
-
-    def test_different_backend_not_equal(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            a = Store(backend=LocalBackend(root=tmp), root_path="data")
-            b = Store(backend=LocalBackend(root=tmp), root_path="data")
-            assert a != b  # different backend instances
-
-    def test_not_equal_to_non_store(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            store = Store(backend=LocalBackend(root=tmp))
-            assert store != "not a store"
+    def test_same_store_equal(self, local_backend: LocalBackend) -> None:
+        a = Store(backend=local_backend, root_path="data")
+        b = Store(backend=local_backend, root_path="data")
+        assert a == b
+
+    def test_different_root_not_equal(self, local_backend: LocalBackend) -> None:
+        a = Store(backend=local_backend, root_path="data")
+        b = Store(backend=local_backend, root_path="other")
+        assert a != b
+
+    def test_different_backend_not_equal(self, tmp_path: Path) -> None:
+        a = Store(backend=LocalBackend(root=str(tmp_path)), root_path="data")
+        b = Store(backend=LocalBackend(root=str(tmp_path)), root_path="data")
+        assert a != b  # different backend instances
+
+    def test_not_equal_to_non_store(self, store_no_root: Store) -> None:
+        assert store_no_root != "not a store"
 
 
 class TestRegistryEquality:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from remote_store._errors import (
@@ -14,6 +16,9 @@ from remote_store._errors import (
     RemoteStoreError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class TestBaseError:
     """ERR-001: RemoteStoreError carries optional path and backend."""
@@ -117,37 +122,33 @@ class TestFlatHierarchy:
     """ERR-008: All errors inherit directly from RemoteStoreError."""
 
     @pytest.mark.spec("ERR-008")
-    def test_all_errors_inherit_directly_from_base(self) -> None:
+    @pytest.mark.parametrize(
+        "cls",
+        [NotFound, AlreadyExists, PermissionDenied, InvalidPath, CapabilityNotSupported, BackendUnavailable],
+        ids=lambda cls: cls.__name__,
+    )
+    def test_inherits_directly_from_base(self, cls: type[RemoteStoreError]) -> None:
         """Concrete errors inherit from RemoteStoreError, not from each other."""
-        concrete = [NotFound, AlreadyExists, PermissionDenied, InvalidPath, CapabilityNotSupported, BackendUnavailable]
-        for cls in concrete:
-            bases = cls.__mro__
-            assert bases[1] is RemoteStoreError, f"{cls.__name__} does not directly inherit RemoteStoreError"
+        assert cls.__mro__[1] is RemoteStoreError
 
 
 class TestStrRepr:
     """ERR-009: Meaningful str/repr output."""
 
     @pytest.mark.spec("ERR-009")
-    def test_str_includes_context(self) -> None:
-        e = NotFound("File not found", path="data/file.txt", backend="s3")
-        s = str(e)
-        assert "data/file.txt" in s
-        assert "s3" in s
-
-    @pytest.mark.spec("ERR-009")
-    def test_repr_includes_class_name(self) -> None:
-        e = NotFound("File not found", path="data/file.txt")
-        r = repr(e)
-        assert "NotFound" in r
-        assert "data/file.txt" in r
-
-    @pytest.mark.spec("ERR-009")
-    def test_capability_str_includes_capability(self) -> None:
-        e = CapabilityNotSupported("nope", capability="atomic_write")
-        assert "atomic_write" in str(e)
-
-    @pytest.mark.spec("ERR-009")
-    def test_capability_repr_includes_capability(self) -> None:
-        e = CapabilityNotSupported("nope", capability="atomic_write")
-        assert "atomic_write" in repr(e)
+    @pytest.mark.parametrize(
+        ("error", "render", "expected"),
+        [
+            (NotFound("File not found", path="data/file.txt", backend="s3"), str, ["data/file.txt", "s3"]),
+            (NotFound("File not found", path="data/file.txt"), repr, ["NotFound", "data/file.txt"]),
+            (CapabilityNotSupported("nope", capability="atomic_write"), str, ["atomic_write"]),
+            (CapabilityNotSupported("nope", capability="atomic_write"), repr, ["atomic_write"]),
+        ],
+        ids=["str-context", "repr-class-name", "capability-str", "capability-repr"],
+    )
+    def test_includes_context(
+        self, error: RemoteStoreError, render: Callable[[object], str], expected: list[str]
+    ) -> None:
+        text = render(error)
+        for fragment in expected:
+            assert fragment in text
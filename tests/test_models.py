@@ -11,6 +11,8 @@ from remote_store._models import FileInfo, FolderInfo, RemoteFile, RemoteFolder
 from remote_store._path import RemotePath
 
 NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PATH_A = RemotePath("a.txt")
+PATH_DATA = RemotePath("data")
 
 
 class TestFileInfoImmutability:
@@ -18,7 +20,7 @@ class TestFileInfoImmutability:
 
     @pytest.mark.spec("MOD-001")
     def test_fileinfo_frozen(self) -> None:
-        fi = FileInfo(path=RemotePath("a.txt"), name="a.txt", size=100, modified_at=NOW)
+        fi = FileInfo(path=PATH_A, name="a.txt", size=100, modified_at=NOW)
         with pytest.raises(dataclasses.FrozenInstanceError):
             fi.size = 200  # type: ignore[misc]
 
@@ -36,7 +38,7 @@ class TestFileInfoFields:
 
     @pytest.mark.spec("MOD-003")
     def test_defaults(self) -> None:
-        fi = FileInfo(path=RemotePath("a.txt"), name="a.txt", size=0, modified_at=NOW)
+        fi = FileInfo(path=PATH_A, name="a.txt", size=0, modified_at=NOW)
         assert fi.checksum is None
         assert fi.content_type is None
         assert fi.extra == {}
@@ -44,7 +46,7 @@ class TestFileInfoFields:
     @pytest.mark.spec("MOD-003")
     def test_optional_set(self) -> None:
         fi = FileInfo(
-            path=RemotePath("a.txt"),
+            path=PATH_A,
             name="a.txt",
             size=10,
             modified_at=NOW,
@@ -62,26 +64,26 @@ class TestFolderInfoFields:
 
     @pytest.mark.spec("MOD-004")
     def test_frozen(self) -> None:
-        fi = FolderInfo(path=RemotePath("data"), file_count=5, total_size=1000)
+        fi = FolderInfo(path=PATH_DATA, file_count=5, total_size=1000)
         with pytest.raises(dataclasses.FrozenInstanceError):
             fi.file_count = 10  # type: ignore[misc]
 
     @pytest.mark.spec("MOD-004")
     def test_required_fields(self) -> None:
-        fi = FolderInfo(path=RemotePath("data"), file_count=5, total_size=1000)
-        assert fi.path == RemotePath("data")
+        fi = FolderInfo(path=PATH_DATA, file_count=5, total_size=1000)
+        assert fi.path == PATH_DATA
         assert fi.file_count == 5
         assert fi.total_size == 1000
 
     @pytest.mark.spec("MOD-005")
     def test_defaults(self) -> None:
-        fi = FolderInfo(path=RemotePath("data"), file_count=0, total_size=0)
+        fi = FolderInfo(path=PATH_DATA, file_count=0, total_size=0)
         assert fi.modified_at is None
         assert fi.extra == {}
 
     @pytest.mark.spec("MOD-005")
     def test_optional_set(self) -> None:
-        fi = FolderInfo(path=RemotePath("data"), file_count=5, total_size=1000, modified_at=NOW, extra={"key": "val"})
+        fi = FolderInfo(path=PATH_DATA, file_count=5, total_size=1000, modified_at=NOW, extra={"key": "val"})
         assert fi.modified_at == NOW
         assert fi.extra == {"key": "val"}
 
@@ -96,18 +98,18 @@ class TestRemoteFileRemoteFolder:
 
     @pytest.mark.spec("MOD-006")
     def test_remotefile_frozen(self) -> None:
-        rf = RemoteFile(path=RemotePath("a.txt"))
+        rf = RemoteFile(path=PATH_A)
         with pytest.raises(dataclasses.FrozenInstanceError):
             rf.path = RemotePath("b.txt")  # type: ignore[misc]
 
     @pytest.mark.spec("MOD-006")
     def test_remotefolder_holds_path(self) -> None:
-        rf = RemoteFolder(path=RemotePath("data"))
-        assert rf.path == RemotePath("data")
+        rf = RemoteFolder(path=PATH_DATA)
+        assert rf.path == PATH_DATA
 
     @pytest.mark.spec("MOD-006")
     def test_remotefolder_frozen(self) -> None:
-        rf = RemoteFolder(path=RemotePath("data"))
+        rf = RemoteFolder(path=PATH_DATA)
         with pytest.raises(dataclasses.FrozenInstanceError):
             rf.path = RemotePath("other")  # type: ignore[misc]
 
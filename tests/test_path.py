@@ -22,68 +22,42 @@ class TestRemotePathImmutability:
 class TestRemotePathNormalization:
     """PATH-002 through PATH-006: normalization rules."""
 
-    @pytest.mark.spec("PATH-002")
-    def test_backslash_to_forward_slash(self) -> None:
-        assert str(RemotePath("a\\b\\c")) == "a/b/c"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param("a\\b\\c", "a/b/c", id="backslash", marks=pytest.mark.spec("PATH-002")),
+            pytest.param("/a/b/", "a/b", id="leading-trailing-slashes", marks=pytest.mark.spec("PATH-004")),
+            pytest.param("/file.txt", "file.txt", id="leading-slash", marks=pytest.mark.spec("PATH-004")),
+            pytest.param("a///b", "a/b", id="consecutive-slashes", marks=pytest.mark.spec("PATH-005")),
+            pytest.param("a/./b", "a/b", id="dot-segment", marks=pytest.mark.spec("PATH-006")),
+            pytest.param("./a/./b/.", "a/b", id="multiple-dot-segments", marks=pytest.mark.spec("PATH-006")),
+        ],
+    )
+    def test_normalized(self, raw: str, expected: str) -> None:
+        assert str(RemotePath(raw)) == expected
 
     @pytest.mark.spec("PATH-003")
-    def test_double_dot_rejected(self) -> None:
+    @pytest.mark.parametrize("raw", ["foo/../bar", "../bar", ".."], ids=["middle", "start", "only"])
+    def test_double_dot_rejected(self, raw: str) -> None:
         with pytest.raises(InvalidPath):
-            RemotePath("foo/../bar")
-
-    @pytest.mark.spec("PATH-003")
-    def test_double_dot_at_start(self) -> None:
-        with pytest.raises(InvalidPath):
-            RemotePath("../bar")
-
-    @pytest.mark.spec("PATH-003")
-    def test_double_dot_only(self) -> None:
-        with pytest.raises(InvalidPath):
-            RemotePath("..")
-
-    @pytest.mark.spec("PATH-004")
-    def test_strip_leading_trailing_slashes(self) -> None:
-        assert str(RemotePath("/a/b/")) == "a/b"
-
-    @pytest.mark.spec("PATH-004")
-    def test_strip_leading_slash(self) -> None:
-        assert str(RemotePath("/file.txt")) == "file.txt"
-
-    @pytest.mark.spec("PATH-005")
-    def test_collapse_consecutive_slashes(self) -> None:
-        assert str(RemotePath("a///b")) == "a/b"
-
-    @pytest.mark.spec("PATH-006")
-    def test_dot_segment_removal(self) -> None:
-        assert str(RemotePath("a/./b")) == "a/b"
-
-    @pytest.mark.spec("PATH-006")
-    def test_multiple_dot_segments(self) -> None:
-        assert str(RemotePath("./a/./b/.")) == "a/b"
+            RemotePath(raw)
 
 
 class TestRemotePathValidation:
     """PATH-007 through PATH-008: input validation."""
 
-    @pytest.mark.spec("PATH-007")
-    def test_null_byte_rejected(self) -> None:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("a/b\0c", id="null-byte", marks=pytest.mark.spec("PATH-007")),
+            pytest.param("", id="empty", marks=pytest.mark.spec("PATH-008")),
+            pytest.param("/", id="slash-only", marks=pytest.mark.spec("PATH-008")),
+            pytest.param(".", id="dot-only", marks=pytest.mark.spec("PATH-008")),
+        ],
+    )
+    def test_rejected(self, raw: str) -> None:
         with pytest.raises(InvalidPath):
-            RemotePath("a/b\0c")
-
-    @pytest.mark.spec("PATH-008")
-    def test_empty_string_rejected(self) -> None:
-        with pytest.raises(InvalidPath):
-            RemotePath("")
-
-    @pytest.mark.spec("PATH-008")
-    def test_slash_only_rejected(self) -> None:
-        with pytest.raises(InvalidPath):
-            RemotePath("/")
-
-    @pytest.mark.spec("PATH-008")
-    def test_dot_only_rejected(self) -> None:
-        with pytest.raises(InvalidPath):
-            RemotePath(".")
+            RemotePath(raw)
 
 
 class TestRemotePathProperties:
@@ -114,20 +88,13 @@ class TestRemotePathProperties:
         assert RemotePath("file.txt").parts == ("file.txt",)
 
     @pytest.mark.spec("PATH-014")
-    def test_suffix_with_extension(self) -> None:
-        assert RemotePath("file.tar.gz").suffix == ".gz"
-
-    @pytest.mark.spec("PATH-014")
-    def test_suffix_no_extension(self) -> None:
-        assert RemotePath("noext").suffix == ""
-
-    @pytest.mark.spec("PATH-014")
-    def test_suffix_single_extension(self) -> None:
-        assert RemotePath("data.csv").suffix == ".csv"
-
-    @pytest.mark.spec("PATH-014")
-    def test_suffix_dotfile(self) -> None:
-        assert RemotePath(".gitignore").suffix == ""
+    @pytest.mark.parametrize(
+        ("raw", "suffix"),
+        [("file.tar.gz", ".gz"), ("noext", ""), ("data.csv", ".csv"), (".gitignore", "")],
+        ids=["double-extension", "no-extension", "single-extension", "dotfile"],
+    )
+    def test_suffix(self, raw: str, suffix: str) -> None:
+        assert RemotePath(raw).suffix == suffix
 
 
 class TestRemotePathJoin:
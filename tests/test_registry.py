@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
-
 import pytest
 
 from remote_store._config import BackendConfig, RegistryConfig, StoreProfile
@@ -21,6 +19,12 @@ def _make_config(root: str) -> RegistryConfig:
     )
 
 
+@pytest.fixture(scope="module")
+def config(tmp_path_factory: pytest.TempPathFactory) -> RegistryConfig:
+    """Shared across the module: RegistryConfig is frozen, and each test builds its own Registry."""
+    return _make_config(str(tmp_path_factory.mktemp("registry")))
+
+
 class TestRegistryConstruction:
     """REG-001: Construction and validation."""
 
@@ -34,69 +38,62 @@ class TestRegistryConstruction:
             Registry(bad_config)
 
     @pytest.mark.spec("REG-001")
-    def test_construction_ok(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            assert reg is not None
+    def test_construction_ok(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        assert reg is not None
 
 
 class TestRegistryGetStore:
     """REG-002 through REG-003: get_store behavior."""
 
     @pytest.mark.spec("REG-002")
-    def test_returns_store(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            store = reg.get_store("main")
-            assert isinstance(store, Store)
+    def test_returns_store(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        store = reg.get_store("main")
+        assert isinstance(store, Store)
 
     @pytest.mark.spec("REG-003")
-    def test_unknown_raises(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            with pytest.raises(KeyError, match="unknown_store"):
-                reg.get_store("unknown_store")
+    def test_unknown_raises(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        with pytest.raises(KeyError, match="unknown_store"):
+            reg.get_store("unknown_store")
 
 
 class TestRegistryBackendLifecycle:
     """REG-004 through REG-006: lazy instantiation, sharing, close."""
 
     @pytest.mark.spec("REG-004")
-    def test_lazy_instantiation(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            assert len(reg._backends) == 0
-            reg.get_store("main")
-            assert len(reg._backends) == 1
+    def test_lazy_instantiation(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        assert len(reg._backends) == 0
+        reg.get_store("main")
+        assert len(reg._backends) == 1
 
     @pytest.mark.spec("REG-005")
-    def test_backend_shared_across_stores(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            reg.get_store("main")
-            reg.get_store("other")
-            assert len(reg._backends) == 1
+    def test_backend_shared_across_stores(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        reg.get_store("main")
+        reg.get_store("other")
+        assert len(reg._backends) == 1
 
     @pytest.mark.spec("REG-006")
-    def test_close_clears_backends(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            reg = Registry(_make_config(tmp))
-            reg.get_store("main")
-            assert len(reg._backends) == 1
-            reg.close()
-            assert len(reg._backends) == 0
+    def test_close_clears_backends(self, config: RegistryConfig) -> None:
+        reg = Registry(config)
+        reg.get_store("main")
+        assert len(reg._backends) == 1
+        reg.close()
+        assert len(reg._backends) == 0
 
 
 class TestRegistryContextManager:
     """REG-007: Context manager support."""
 
     @pytest.mark.spec("REG-007")
-    def test_context_manager(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            with Registry(_make_config(tmp)) as reg:
-                store = reg.get_store("main")
-                assert isinstance(store, Store)
-            assert len(reg._backends) == 0
+    def test_context_manager(self, config: RegistryConfig) -> None:
+        with Registry(config) as reg:
+            store = reg.get_store("main")
+            assert isinstance(store, Store)
+        assert len(reg._backends) == 0
 
 
 class TestRegistryBackendFactory:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import tempfile
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -12,23 +12,17 @@ from remote_store._models import FileInfo, FolderInfo
 from remote_store._store import Store
 from remote_store.backends._local import LocalBackend
 
-
-@pytest.fixture
-def store() -> Store:
-    with tempfile.TemporaryDirectory() as tmp:
-        backend = LocalBackend(root=tmp)
-        yield Store(backend=backend, root_path="data")  # type: ignore[misc]
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestStoreConstruction:
     """STORE-001: Construction."""
 
     @pytest.mark.spec("STORE-001")
-    def test_construction(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="myroot")
-            assert store is not None
+    def test_construction(self, local_backend: LocalBackend) -> None:
+        store = Store(backend=local_backend, root_path="myroot")
+        assert store is not None
 
 
 class TestStorePathValidation:
@@ -43,7 +37,7 @@ class TestStorePathValidation:
     def test_empty_path_resolves_to_root(self, store: Store) -> None:
         store.write("file.txt", b"data")
         assert store.is_folder("")
-        assert list(store.list_files("")) == list(store.list_files("", recursive=False))
+        assert [str(f.path) for f in store.list_files("")] == ["file.txt"]
 
 
 class TestStoreRootPathScoping:
@@ -109,20 +103,21 @@ class TestStoreFullAPI:
         assert store.read_bytes("at.txt") == b"atomic"
 
     @pytest.mark.spec("STORE-008")
-    def test_delete(self, store: Store) -> None:
-        store.write("del.txt", b"x")
-        store.delete("del.txt")
+    @pytest.mark.parametrize(
+        ("seed", "missing_ok", "raises"),
+        [(True, False, None), (False, True, None), (False, False, NotFound)],
+        ids=["existing", "missing_ok", "not_found"],
+    )
+    def test_delete(self, store: Store, seed: bool, missing_ok: bool, raises: type[Exception] | None) -> None:
+        if seed:
+            store.write("del.txt", b"x")
+        if raises is None:
+            store.delete("del.txt", missing_ok=missing_ok)
+        else:
+            with pytest.raises(raises):
+                store.delete("del.txt", missing_ok=missing_ok)
         assert store.exists("del.txt") is False
 
-    @pytest.mark.spec("STORE-008")
-    def test_delete_missing_ok(self, store: Store) -> None:
-        store.delete("nonexistent.txt", missing_ok=True)
-
-    @pytest.mark.spec("STORE-008")
-    def test_delete_not_found(self, store: Store) -> None:
-        with pytest.raises(NotFound):
-            store.delete("nonexistent.txt")
-
     @pytest.mark.spec("STORE-008")
     def test_delete_folder(self, store: Store) -> None:
         store.write("folder/file.txt", b"x")
@@ -180,53 +175,66 @@ class TestStoreFullAPI:
         assert store.read_bytes("cp_dst.txt") == b"data"
 
 
+_ROUND_TRIP_FILES = {
+    "reports/q1.csv": b"data",
+    "rt/a.txt": b"aaa",
+    "rt/b.txt": b"bbb",
+    "file.txt": b"x",
+    "a/b/c.txt": b"deep",
+    "info.txt": b"hello",
+    "fold/a.txt": b"a",
+}
+
+
+@pytest.fixture(scope="module")
+def populated_store(tmp_path_factory: pytest.TempPathFactory) -> Store:
+    """Seeded once; the round-trip tests only read and list."""
+    store = Store(backend=LocalBackend(root=str(tmp_path_factory.mktemp("round_trip"))), root_path="data")
+    for path, content in _ROUND_TRIP_FILES.items():
+        store.write(path, content)
+    return store
+
+
 class TestStoreRoundTrip:
     """NPR-001, NPR-014 through NPR-016: round-trip invariant."""
 
     @pytest.mark.spec("NPR-001")
-    def test_list_files_returns_store_relative_paths(self, store: Store) -> None:
-        store.write("reports/q1.csv", b"data")
-        files = list(store.list_files("reports"))
+    def test_list_files_returns_store_relative_paths(self, populated_store: Store) -> None:
+        files = list(populated_store.list_files("reports"))
         assert len(files) == 1
         assert str(files[0].path) == "reports/q1.csv"
 
     @pytest.mark.spec("NPR-001")
-    def test_list_files_round_trip(self, store: Store) -> None:
+    def test_list_files_round_trip(self, populated_store: Store) -> None:
         """FileInfo.path from listing is directly usable as Store method input."""
-        store.write("rt/a.txt", b"aaa")
-        store.write("rt/b.txt", b"bbb")
-        for f in store.list_files("rt"):
-            data = store.read_bytes(str(f.path))
+        for f in populated_store.list_files("rt"):
+            data = populated_store.read_bytes(str(f.path))
             assert len(data) == 3
 
     @pytest.mark.spec("NPR-014")
-    def test_list_files_no_root_prefix(self, store: Store) -> None:
+    def test_list_files_no_root_prefix(self, populated_store: Store) -> None:
         """FileInfo.path must NOT include the store's root_path."""
-        store.write("file.txt", b"x")
-        files = list(store.list_files(""))
+        files = list(populated_store.list_files(""))
         paths = {str(f.path) for f in files}
         # Must be "file.txt", not "data/file.txt"
         assert "file.txt" in paths
         assert not any(p.startswith("data/") for p in paths)
 
     @pytest.mark.spec("NPR-016")
-    def test_round_trip_recursive(self, store: Store) -> None:
-        store.write("a/b/c.txt", b"deep")
-        for f in store.list_files("", recursive=True):
-            assert store.read_bytes(str(f.path)) == b"deep"
+    def test_round_trip_recursive(self, populated_store: Store) -> None:
+        for f in populated_store.list_files("a", recursive=True):
+            assert populated_store.read_bytes(str(f.path)) == b"deep"
 
     @pytest.mark.spec("NPR-014")
-    def test_get_file_info_returns_store_relative(self, store: Store) -> None:
-        store.write("info.txt", b"hello")
-        fi = store.get_file_info("info.txt")
+    def test_get_file_info_returns_store_relative(self, populated_store: Store) -> None:
+        fi = populated_store.get_file_info("info.txt")
         assert str(fi.path) == "info.txt"
         # Round-trip: path should work as input
-        assert store.read_bytes(str(fi.path)) == b"hello"
+        assert populated_store.read_bytes(str(fi.path)) == b"hello"
 
     @pytest.mark.spec("NPR-014")
-    def test_get_folder_info_returns_store_relative(self, store: Store) -> None:
-        store.write("fold/a.txt", b"a")
-        fi = store.get_folder_info("fold")
+    def test_get_folder_info_returns_store_relative(self, populated_store: Store) -> None:
+        fi = populated_store.get_folder_info("fold")
         assert str(fi.path) == "fold"
 
 
@@ -234,25 +242,16 @@ class TestStoreToKey:
     """NPR-010 through NPR-013: Store.to_key."""
 
     @pytest.mark.spec("NPR-010")
-    def test_to_key_strips_root(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            native = f"{tmp}/data/reports/q1.csv"
-            assert store.to_key(native) == "reports/q1.csv"
+    def test_to_key_strips_root(self, store: Store, tmp_path: Path) -> None:
+        native = f"{tmp_path}/data/reports/q1.csv"
+        assert store.to_key(native) == "reports/q1.csv"
 
     @pytest.mark.spec("NPR-012")
-    def test_to_key_no_root_path(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="")
-            native = f"{tmp}/reports/q1.csv"
-            assert store.to_key(native) == "reports/q1.csv"
+    def test_to_key_no_root_path(self, store_no_root: Store, tmp_path: Path) -> None:
+        native = f"{tmp_path}/reports/q1.csv"
+        assert store_no_root.to_key(native) == "reports/q1.csv"
 
     @pytest.mark.spec("NPR-013")
-    def test_to_key_unrelated_path_raises(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            backend = LocalBackend(root=tmp)
-            store = Store(backend=backend, root_path="data")
-            with pytest.raises(InvalidPath):
-                store.to_key(f"{tmp}/other/file.txt")
+    def test_to_key_unrelated_path_raises(self, store: Store, tmp_path: Path) -> None:
+        with pytest.raises(InvalidPath):
+            store.to_key(f"{tmp_path}/other/file.txt")